@@ -77,6 +77,9 @@ async def main() -> None:
     # Output directory
     parser.add_argument("--output-dir", "-o", type=str,
                         help="Data directory for reading raw data and writing output (default: data/)")
+    parser.add_argument("--csv",
+                        action="store_true",
+                        help="Also write CSV copies of processed tables (Parquet is always written)")
 
     args = parser.parse_args()
 
@@ -91,7 +94,7 @@ async def main() -> None:
     logger.info(f"Logging level set to {'DEBUG' if args.debug else 'INFO'}")
 
     # Set config
-    configure(gender=args.gender, data_dir=args.output_dir)
+    configure(gender=args.gender, data_dir=args.output_dir, write_csv=args.csv)
     if args.output_dir:
         ensure_dirs()
     logger.info(f"Using gender: {args.gender}")
@@ -114,7 +117,8 @@ async def main() -> None:
                          gender=args.gender,
                          force=args.force,
                          game_ids=args.game_ids,
-                         verbose=args.verbose)
+                         verbose=args.verbose,
+                         write_csv=args.csv)
     elif args.scrape:
         # Only run the scraper
         logger.info(f"Running data scraper for {get_current_gender()} basketball")
@@ -146,7 +150,8 @@ async def main() -> None:
                          gender=args.gender,
                          game_ids=args.game_ids,
                          force=args.force,
-                         verbose=args.verbose)
+                         verbose=args.verbose,
+                         write_csv=args.csv)
 
     logger.info("Workflow completed successfully")
 
@@ -34,6 +34,13 @@ _NOISE_PLAY_TYPES = frozenset([
 REGULATION_SECONDS = 2400  # 2 × 20-minute halves
 GARBAGE_CUTOFF_SECONDS = 120  # last 2 minutes excluded for trunc metric
 
+# Play-by-play columns the metrics actually use; reading only these lets
+# pyarrow skip the remaining column chunks in the season file.
+_PBP_COLUMNS = [
+    "game_id", "play_type", "score_home", "score_away",
+    "clock_seconds", "period", "sequence_number",
+]
+
 
 # ---------------------------------------------------------------------------
 # Naive (score-only) win probability model
@@ -261,7 +268,7 @@ def compute_season_metrics(
     if not pbp_path.exists():
         raise FileNotFoundError(f"No play-by-play data at {pbp_path}")
 
-    pbp = pd.read_parquet(pbp_path)
+    pbp = pd.read_parquet(pbp_path, columns=_PBP_COLUMNS)
     logger.info(f"Loaded {len(pbp):,} plays for {gender} {season}")
 
     return compute_game_metrics(pbp, wp_model=wp_model)
@@ -296,7 +303,7 @@ def compute_multi_season_metrics(
         if not pbp_path.exists():
             logger.warning(f"No play-by-play data for {gender} {season}, skipping")
             continue
-        df = pd.read_parquet(pbp_path)
+        df = pd.read_parquet(pbp_path, columns=_PBP_COLUMNS)
         df["season"] = season
         all_pbp.append(df)
 
@@ -1,15 +1,18 @@
 """Process and transform ESPN data into structured formats."""
 
 import os
+import contextlib
 import json
 import logging
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
-from datetime import datetime, timezone
 import argparse
 
 from espn_data.utils import (load_json, save_json, get_teams_file, get_schedules_dir, get_games_dir, get_processed_dir,
@@ -61,6 +64,12 @@ _DNP_STAT_FIELDS = [
 # Shooting stats to split from "made-attempted" format
 _SHOOTING_STATS = ['FG', '3PT', 'FT']
 
+# Row group size for season play_by_play Parquet files (enables row-group pruning on read)
+_PBP_ROW_GROUP_SIZE = 50_000
+
+# Games processed per worker task in process_all_games
+_GAME_CHUNK_SIZE = 50
+
 
 # ---------------------------------------------------------------------------
 # Small utility helpers
@@ -81,19 +90,19 @@ def _split_shooting_stat(value: str, prefix: str) -> dict:
         return {f"{prefix}_MADE": np.nan, f"{prefix}_ATT": np.nan, f"{prefix}_PCT": np.nan}
 
 
-def _nan_shooting_stats() -> dict:
-    """Return NaN values for all shooting stat fields (for DNP players)."""
-    result = {}
-    for stat in _SHOOTING_STATS:
-        result[f"{stat}_MADE"] = np.nan
-        result[f"{stat}_ATT"] = np.nan
-        result[f"{stat}_PCT"] = np.nan
-    return result
+def _as_dict(value: Any) -> dict:
+    """Return value if it is a dict, else an empty dict (for chaining .get calls)."""
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> list:
+    """Return value if it is a list, else an empty list."""
+    return value if isinstance(value, list) else []
 
 
 def _get_competition(game_data: dict) -> dict:
     """Get the first competition entry from game data, or empty dict."""
-    competitions = game_data.get('header', {}).get('competitions', [])
+    competitions = (game_data.get('header') or {}).get('competitions')
     if competitions and isinstance(competitions, list):
         return competitions[0]
     return {}
@@ -123,24 +132,82 @@ def _extract_game_id(game_data: dict, filename: str = None) -> str:
     return 'unknown'
 
 
+def _resolve_status(status: Any) -> Optional[str]:
+    """Resolve a game status (plain string or ESPN status dict) to a string."""
+    if isinstance(status, dict):
+        status = status.get("description") or status.get("short_detail") or status.get("name")
+    return status if isinstance(status, str) else None
+
+
 def _extract_team_identity(team_data: dict) -> tuple:
     """Extract (team_id, team_name, team_abbrev) from a boxscore team entry."""
-    team = team_data.get('team')
-    if team and isinstance(team, dict):
-        return (team.get('id'), team.get('displayName'), team.get('abbreviation'))
-    return (None, None, None)
+    team = _as_dict(team_data.get('team'))
+    return (team.get('id'), team.get('displayName'), team.get('abbreviation'))
+
+
+def _save_table(df: pd.DataFrame, csv_path: Path, parquet_path: Path,
+                row_group_size: Optional[int] = None) -> None:
+    """Write a table to Parquet, plus CSV when enabled via configure(write_csv=True).
+
+    Both formats are written from the same Arrow data. With ``row_group_size``,
+    rows are converted and written one row group at a time so only that many rows
+    are held as Arrow data at once.
+    """
+    write_csv = get_config().write_csv
+
+    if row_group_size is None or len(df) <= row_group_size:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if write_csv:
+            pacsv.write_csv(table, csv_path)
+        pq.write_table(table, parquet_path, compression='snappy')
+        return
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with contextlib.ExitStack() as stack:
+        writer = stack.enter_context(pq.ParquetWriter(parquet_path, schema, compression='snappy'))
+        csv_writer = stack.enter_context(pacsv.CSVWriter(csv_path, schema)) if write_csv else None
+        for start in range(0, len(df), row_group_size):
+            chunk = df.iloc[start:start + row_group_size]
+            batch = pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+            writer.write_batch(batch)
+            if csv_writer is not None:
+                csv_writer.write_batch(batch)
 
 
 # ---------------------------------------------------------------------------
 # Teams processing
 # ---------------------------------------------------------------------------
 
+# Flattened ESPN team fields → processed column names
+_TEAM_COLUMNS = {
+    "id": "id",
+    "slug": "slug",
+    "abbreviation": "abbreviation",
+    "displayName": "display_name",
+    "shortDisplayName": "short_name",
+    "name": "name",
+    "nickname": "nickname",
+    "location": "location",
+    "color": "color",
+    "alternateColor": "alternate_color",
+    "conference_id": "conference_id",
+    "conference_name": "conference_name",
+}
+
+# Output column order for the teams table
+_TEAMS_OUTPUT_COLUMNS = [
+    "id", "slug", "abbreviation", "display_name", "short_name", "name", "nickname",
+    "location", "color", "alternate_color", "logo", "conference_id", "conference_name",
+]
+
+
 def process_teams_data(force: bool = False) -> pd.DataFrame:
     """Process teams data into a structured dataframe."""
     csv_teams_file = get_csv_teams_file()
-    if not force and csv_teams_file.exists():
+    parquet_teams_file = get_parquet_teams_file()
+    if not force and parquet_teams_file.exists():
         logger.info("Using cached processed teams data")
-        return pd.read_csv(csv_teams_file)
+        return pd.read_parquet(parquet_teams_file, engine='pyarrow')
 
     logger.info("Processing teams data")
     teams_file = get_teams_file()
@@ -154,31 +221,19 @@ def process_teams_data(force: bool = False) -> pd.DataFrame:
         logger.warning("No teams data found")
         return pd.DataFrame()
 
-    teams = []
-    for team in teams_data:
-        teams.append({
-            "id": team.get("id"),
-            "slug": team.get("slug"),
-            "abbreviation": team.get("abbreviation"),
-            "display_name": team.get("displayName"),
-            "short_name": team.get("shortDisplayName"),
-            "name": team.get("name"),
-            "nickname": team.get("nickname"),
-            "location": team.get("location"),
-            "color": team.get("color"),
-            "alternate_color": team.get("alternateColor"),
-            "logo": team.get("logos", [{}])[0].get("href") if team.get("logos") else None,
-            "conference_id": team.get("conference", {}).get("id") if "conference" in team else None,
-            "conference_name": team.get("conference", {}).get("name") if "conference" in team else None,
-        })
+    raw = pd.json_normalize(teams_data, sep='_', max_level=1)
+    raw = raw.reindex(columns=[*_TEAM_COLUMNS, 'logos'])
+    raw['logo'] = [logos[0].get('href') if isinstance(logos, list) and logos and isinstance(logos[0], dict) else None
+                   for logos in raw['logos']]
 
-    teams_df = pd.DataFrame(teams)
+    teams_df = raw.rename(columns=_TEAM_COLUMNS)[_TEAMS_OUTPUT_COLUMNS]
 
     if not teams_df.empty:
         teams_df = optimize_dataframe_dtypes(teams_df, "teams")
-        os.makedirs(csv_teams_file.parent, exist_ok=True)
-        teams_df.to_csv(csv_teams_file, index=False)
-        teams_df.to_parquet(get_parquet_teams_file(), index=False)
+        os.makedirs(parquet_teams_file.parent, exist_ok=True)
+        if get_config().write_csv:
+            os.makedirs(csv_teams_file.parent, exist_ok=True)
+        _save_table(teams_df, csv_teams_file, parquet_teams_file)
         logger.info(f"Processed {len(teams_df)} teams")
     else:
         logger.warning("No teams data to save")
@@ -203,6 +258,19 @@ def convert_clock_to_seconds(clock_str):
         return None
 
 
+def _clock_column_to_seconds(clock: pd.Series) -> pd.Series:
+    """Convert a column of clock strings (MM:SS) to seconds in one pass.
+
+    Column-wise counterpart of convert_clock_to_seconds; invalid clocks become NaN.
+    """
+    # Cast so .str works on all-numeric columns too; numbers never match MM:SS
+    parts = clock.astype('string').str.extract(r'^\s*([+-]?\d+)\s*:\s*([+-]?\d+)\s*$')
+    seconds = (pd.to_numeric(parts[0]) * 60 + pd.to_numeric(parts[1])).astype('float64')
+    if seconds.notna().all():
+        return seconds.astype('int64')
+    return seconds
+
+
 def get_broadcasts(game_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Get broadcasts from game data, checking multiple locations."""
     return (game_data.get('broadcasts', [])
@@ -212,37 +280,53 @@ def get_broadcasts(game_data: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 def get_primary_broadcast(game_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Get the primary broadcast, preferring national TV."""
-    broadcasts = get_broadcasts(game_data)
-    if not broadcasts:
-        return None
+    return _pick_primary_broadcast(get_broadcasts(game_data))
 
-    # Priority: national TV > any TV > any national > first
-    for broadcast in broadcasts:
-        market_type = broadcast.get('market', {}).get('type', '').lower()
-        type_name = broadcast.get('type', {}).get('shortName', '').lower()
-        if type_name == 'tv' and market_type == 'national':
-            return broadcast
 
-    for broadcast in broadcasts:
-        if broadcast.get('type', {}).get('shortName', '').lower() == 'tv':
-            return broadcast
+def _pick_primary_broadcast(broadcasts: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Pick the primary broadcast from an already-resolved broadcast list."""
+    if not broadcasts:
+        return None
 
+    # Priority: national TV (3) > any TV (2) > any national (1) > first (0)
+    best, best_score = broadcasts[0], 0
     for broadcast in broadcasts:
-        if broadcast.get('market', {}).get('type', '').lower() == 'national':
-            return broadcast
+        market_type = ((broadcast.get('market') or {}).get('type') or '').lower()
+        type_name = ((broadcast.get('type') or {}).get('shortName') or '').lower()
+        score = (2 if type_name == 'tv' else 0) + (1 if market_type == 'national' else 0)
+        if score > best_score:
+            if score == 3:
+                return broadcast
+            best, best_score = broadcast, score
 
-    return broadcasts[0]
+    return best
 
 
 # ---------------------------------------------------------------------------
 # Game detail extraction
 # ---------------------------------------------------------------------------
 
-def get_game_details(game_data: Dict[str, Any], filename: str = None) -> Dict[str, Any]:
-    """Extract key game details from raw API data."""
+def get_game_details(game_data: Dict[str, Any], filename: str = None,
+                     broadcasts: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Extract key game details from raw API data.
+
+    Pass ``broadcasts`` (from get_broadcasts) to avoid resolving them again.
+    """
     game_id = _extract_game_id(game_data, filename)
+    header = game_data.get('header') or {}
     competition = _get_competition(game_data)
+    game_info = game_data.get('gameInfo') or {}
+
+    # Unpack the competition fields once
     group = competition.get('groups', {})
+    competitors = _as_list(competition.get('competitors'))
+    status_source = competition if 'status' in competition else game_data
+    status_type = _as_dict(_as_dict(status_source.get('status')).get('type'))
+    neutral_site = competition.get('neutralSite', False)
+    game_format = _as_dict(competition.get('format') or game_data.get('format'))
+    regulation = _as_dict(game_format.get('regulation'))
+    overtime = _as_dict(game_format.get('overtime'))
+    competition_attendance = competition.get('attendance')
 
     logger.debug(f"Game {game_id}: Extracting game details")
 
@@ -255,8 +339,12 @@ def get_game_details(game_data: Dict[str, Any], filename: str = None) -> Dict[st
         "venue_state": None,
         "attendance": None,
         "status": None,
-        "neutral_site": competition.get('neutralSite', False),
-        "format": competition.get('format') or game_data.get('format'),
+        "neutral_site": neutral_site,
+        # Game format, flattened to scalars (defaults when ESPN omits it)
+        "regulation_clock": regulation.get('clock', 600.0),
+        "overtime_clock": overtime.get('clock', 300.0),
+        "period_name": regulation.get('displayName', "Quarter"),
+        "num_periods": regulation.get('periods', 4),
         "completed": False,
         "broadcast": None,
         "broadcast_market": None,
@@ -276,11 +364,11 @@ def get_game_details(game_data: Dict[str, Any], filename: str = None) -> Dict[st
     # Season
     if 'season' in game_data and isinstance(game_data['season'], dict):
         game_details["season"] = game_data['season'].get('year')
-    elif isinstance(game_data.get('header'), dict):
-        game_details["season"] = game_data['header'].get('season', {}).get('year')
+    elif header:
+        game_details["season"] = header.get('season', {}).get('year')
 
     # Venue
-    venue_data = game_data.get('gameInfo', {}).get('venue', {})
+    venue_data = game_info.get('venue', {})
     if venue_data:
         game_details["venue_id"] = venue_data.get('id')
         game_details["venue_name"] = venue_data.get('fullName')
@@ -290,101 +378,100 @@ def get_game_details(game_data: Dict[str, Any], filename: str = None) -> Dict[st
 
     # Attendance — check multiple locations
     for source in [
-        game_data.get('gameInfo', {}).get('attendance'),
+        game_info.get('attendance'),
         game_data.get('attendance'),
         game_data.get('boxscore', {}).get('attendance'),
-        competition.get('attendance'),
+        competition_attendance,
     ]:
         if source is not None:
             game_details["attendance"] = source
             break
 
     # Status
-    status_type = None
-    if competition and 'status' in competition:
-        status_type = competition['status'].get('type', {})
-    elif 'status' in game_data:
-        status_type = game_data['status'].get('type', {})
-
-    if status_type and isinstance(status_type, dict):
+    if status_type:
         game_details["status"] = status_type.get('name')
         game_details["completed"] = status_type.get('completed', False)
 
     # Broadcast
-    broadcast = get_primary_broadcast(game_data)
+    if broadcasts is None:
+        broadcasts = get_broadcasts(game_data)
+    broadcast = _pick_primary_broadcast(broadcasts)
     if broadcast:
         game_details["broadcast"] = broadcast.get('media', {}).get('shortName')
         game_details["broadcast_market"] = broadcast.get('market', {}).get('type')
         game_details["broadcast_type"] = broadcast.get('type', {}).get('shortName')
 
     # Teams
-    competitors = competition.get('competitors', [])
-    if isinstance(competitors, list):
-        for team in competitors:
-            if not isinstance(team, dict) or not isinstance(team.get('team'), dict):
-                continue
+    for team in competitors:
+        if not isinstance(team, dict) or not isinstance(team.get('team'), dict):
+            continue
 
-            team_obj = team['team']
-            groups = team_obj.get("groups", {})
-            parent = groups.get("parent", {})
-
-            team_info = {
-                "id": team_obj.get('id'),
-                "name": team_obj.get('displayName'),
-                "abbreviation": team_obj.get('abbreviation'),
-                "location": team_obj.get('location'),
-                "nickname": team_obj.get('name'),
-                "color": team_obj.get('color'),
-                "home_away": team.get('homeAway'),
-                "score": team.get('score'),
-                "winner": team.get('winner', False),
-                "groups_slug": groups.get("slug"),
-                "conference_id": groups.get("id"),
-                "conference_slug": groups.get("slug"),
-                "division": parent.get("name"),
-            }
+        team_obj = team['team']
+        groups = _as_dict(team_obj.get("groups"))
+        parent = _as_dict(groups.get("parent"))
+
+        team_info = {
+            "id": team_obj.get('id'),
+            "name": team_obj.get('displayName'),
+            "abbreviation": team_obj.get('abbreviation'),
+            "location": team_obj.get('location'),
+            "nickname": team_obj.get('name'),
+            "color": team_obj.get('color'),
+            "home_away": team.get('homeAway'),
+            "score": team.get('score'),
+            "winner": team.get('winner', False),
+            "groups_slug": groups.get("slug"),
+            "conference_id": groups.get("id"),
+            "conference_slug": groups.get("slug"),
+            "division": parent.get("name"),
+        }
 
-            if 'linescores' in team and isinstance(team['linescores'], list):
-                team_info['linescores'] = [
-                    line.get('displayValue') for line in team['linescores'] if isinstance(line, dict)
-                ]
+        if 'linescores' in team and isinstance(team['linescores'], list):
+            team_info['linescores'] = [
+                line.get('displayValue') for line in team['linescores'] if isinstance(line, dict)
+            ]
 
-            game_details["teams"].append(team_info)
+        game_details["teams"].append(team_info)
 
     # Build team lookup and fill empty team/player names in play-by-play
     team_lookup = {t["id"]: {"name": t["name"], "abbreviation": t["abbreviation"]}
                    for t in game_details["teams"]}
 
-    if 'plays' in game_data and isinstance(game_data['plays'], list):
+    athlete_name_by_id = {}
+    for *_, player in _iter_boxscore_athletes(game_data):
+        if isinstance(player.get('athlete'), dict):
+            aid = player['athlete'].get('id')
+            if aid:
+                athlete_name_by_id[aid] = player['athlete'].get('displayName', '')
+
+    # Nothing to backfill from (e.g. no boxscore) -- skip the plays pass entirely
+    need_team_fix = bool(team_lookup)
+    need_player_fix = bool(athlete_name_by_id)
+
+    if (need_team_fix or need_player_fix) and isinstance(game_data.get('plays'), list):
         for play in game_data['plays']:
             if not isinstance(play, dict) or 'team' not in play:
                 continue
 
-            if isinstance(play['team'], dict):
-                tid = play['team'].get('id')
-                if tid and not play['team'].get('name') and tid in team_lookup:
-                    play['team']['name'] = team_lookup[tid]['name']
-            elif isinstance(play['team'], str):
-                logger.debug(f"Game {game_id}: Found play with team as string: {play['team']}")
+            if need_team_fix:
+                if isinstance(play['team'], dict):
+                    tid = play['team'].get('id')
+                    if tid and not play['team'].get('name') and tid in team_lookup:
+                        play['team']['name'] = team_lookup[tid]['name']
+                elif isinstance(play['team'], str):
+                    logger.debug(f"Game {game_id}: Found play with team as string: {play['team']}")
 
             # Fill player names from boxscore if missing
-            for player_num in [1, 2]:
-                player_key = f'athlete{player_num}'
-                athlete = play.get(player_key)
-                if not isinstance(athlete, dict):
-                    continue
-                player_id = athlete.get('id')
-                if not player_id or athlete.get('displayName'):
-                    continue
-                # Search boxscore for this player's name
-                for team_players in game_data.get('boxscore', {}).get('players', []):
-                    for stat_group in team_players.get('statistics', []):
-                        if not isinstance(stat_group, dict):
-                            continue
-                        for player in stat_group.get('athletes', []):
-                            if (isinstance(player, dict) and isinstance(player.get('athlete'), dict)
-                                    and player['athlete'].get('id') == player_id):
-                                athlete['displayName'] = player['athlete'].get('displayName', '')
+            if need_player_fix:
+                for player_key in ('athlete1', 'athlete2'):
+                    athlete = play.get(player_key)
+                    if not isinstance(athlete, dict):
+                        continue
+                    player_id = athlete.get('id')
+                    if not player_id or athlete.get('displayName'):
+                        continue
+                    if player_id in athlete_name_by_id:
+                        athlete['displayName'] = athlete_name_by_id[player_id]
 
     return game_details
 
@@ -393,6 +480,18 @@ def get_game_details(game_data: Dict[str, Any], filename: str = None) -> Dict[st
 # Extraction helpers for process_game_data
 # ---------------------------------------------------------------------------
 
+def _records_to_frame(records: list) -> pd.DataFrame:
+    """Build a DataFrame from row dicts, taking the column layout from the dicts' own keys.
+
+    Columns are the union of keys in first-seen order, so optional fields (e.g.
+    linescores) are kept even when only some rows have them.
+    """
+    if not records:
+        return pd.DataFrame()
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    return pd.DataFrame.from_records(records, columns=columns)
+
+
 def _extract_officials(game_id: str, game_data: dict) -> list:
     """Extract officials/referees from game data."""
     officials = []
@@ -410,13 +509,13 @@ def _extract_officials(game_id: str, game_data: dict) -> list:
     return officials
 
 
-def _extract_broadcasts(game_id: str, game_data: dict) -> list:
-    """Extract broadcast information from game data."""
-    broadcasts = []
-    for broadcast in get_broadcasts(game_data):
+def _extract_broadcasts(game_id: str, broadcasts: list) -> list:
+    """Extract broadcast rows from the list returned by get_broadcasts."""
+    rows = []
+    for broadcast in broadcasts:
         if broadcast is None:
             continue
-        broadcasts.append({
+        rows.append({
             "game_id": game_id,
             "type": broadcast.get("type", {}).get("shortName"),
             "market": broadcast.get("market", {}).get("type"),
@@ -424,7 +523,7 @@ def _extract_broadcasts(game_id: str, game_data: dict) -> list:
             "lang": broadcast.get("lang"),
             "region": broadcast.get("region"),
         })
-    return broadcasts
+    return rows
 
 
 def _extract_teams_info(game_id: str, game_details: dict) -> list:
@@ -458,12 +557,12 @@ def _extract_teams_info(game_id: str, game_details: dict) -> list:
     return teams_info
 
 
-def _extract_player_stats(game_id: str, game_data: dict) -> list:
-    """Extract per-player statistics from boxscore data."""
-    player_stats = []
-    boxscore_players = game_data.get('boxscore', {}).get('players', [])
+def _iter_boxscore_athletes(game_data: dict):
+    """Yield (team_id, team_name, team_abbrev, stat_keys, stat_labels, athlete) per boxscore athlete.
 
-    for team_data in boxscore_players:
+    Flattens the boxscore.players → statistics → athletes nesting, skipping malformed entries.
+    """
+    for team_data in game_data.get('boxscore', {}).get('players', []):
         if not isinstance(team_data, dict):
             continue
 
@@ -477,60 +576,92 @@ def _extract_player_stats(game_id: str, game_data: dict) -> list:
             stat_labels = stat_group.get('names', []) or stat_group.get('labels', [])
 
             for athlete in stat_group.get('athletes', []):
-                if not isinstance(athlete, dict):
-                    continue
-
-                athlete_info = athlete.get('athlete', {})
-                if not isinstance(athlete_info, dict):
-                    athlete_info = {}
-
-                position_info = athlete_info.get('position')
-                starter = bool(athlete.get('starter'))
-                dnp = bool(athlete.get('didNotPlay'))
-
-                record = {
-                    "game_id": game_id,
-                    "team_id": team_id,
-                    "team_name": team_name,
-                    "team_abbrev": team_abbrev,
-                    "player_id": athlete_info.get('id'),
-                    "player_name": athlete_info.get('displayName'),
-                    "position": position_info.get('abbreviation') if isinstance(position_info, dict) else None,
-                    "jersey": athlete_info.get('jersey'),
-                    "starter": starter,
-                    "dnp": dnp,
-                }
-
-                # Map stat values to labels
-                stat_values = athlete.get('stats', [])
-                for i, key in enumerate(stat_keys):
-                    if i < len(stat_values):
-                        col = stat_labels[i] if i < len(stat_labels) else key
-                        record[col] = stat_values[i]
-
-                # Split shooting stats (e.g. "15-25" → _MADE, _ATT, _PCT)
-                for stat_name in _SHOOTING_STATS:
-                    val = record.get(stat_name)
-                    if isinstance(val, str) and '-' in val:
-                        record.update(_split_shooting_stat(val, stat_name))
-                    elif dnp:
-                        record.update(_nan_shooting_stats())
-
-                # Rename verbose stat names to standard abbreviations
-                for old_name, new_name in _VERBOSE_STAT_NAMES.items():
-                    if old_name in record:
-                        record[new_name] = record.pop(old_name)
-
-                # Ensure DNP players have NaN for all stat fields
-                if dnp:
-                    for field in ['MIN', 'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TO', 'PF', 'PTS']:
-                        record[field] = np.nan
-
-                player_stats.append(record)
+                if isinstance(athlete, dict):
+                    yield team_id, team_name, team_abbrev, stat_keys, stat_labels, athlete
+
+
+def _extract_player_stats(game_id: str, game_data: dict) -> list:
+    """Extract per-player statistics from boxscore data."""
+    player_stats = []
+
+    for team_id, team_name, team_abbrev, stat_keys, stat_labels, athlete in _iter_boxscore_athletes(game_data):
+        athlete_info = _as_dict(athlete.get('athlete'))
+        starter = bool(athlete.get('starter'))
+        dnp = bool(athlete.get('didNotPlay'))
+
+        record = {
+            "game_id": game_id,
+            "team_id": team_id,
+            "team_name": team_name,
+            "team_abbrev": team_abbrev,
+            "player_id": athlete_info.get('id'),
+            "player_name": athlete_info.get('displayName'),
+            "position": _as_dict(athlete_info.get('position')).get('abbreviation'),
+            "jersey": athlete_info.get('jersey'),
+            "starter": starter,
+            "dnp": dnp,
+        }
+
+        # Map stat values to labels
+        stat_values = athlete.get('stats', [])
+        for i, key in enumerate(stat_keys):
+            if i < len(stat_values):
+                col = stat_labels[i] if i < len(stat_labels) else key
+                record[col] = stat_values[i]
+
+        # Rename verbose stat names to standard abbreviations
+        for old_name, new_name in _VERBOSE_STAT_NAMES.items():
+            if old_name in record:
+                record[new_name] = record.pop(old_name)
+
+        # Ensure DNP players have NaN for all stat fields
+        if dnp:
+            for field in ['MIN', 'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TO', 'PF', 'PTS']:
+                record[field] = np.nan
+
+        player_stats.append(record)
 
     return player_stats
 
 
+def _split_shooting_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Split shooting stat columns like '15-25' into _MADE, _ATT, _PCT columns.
+
+    Column-wise counterpart of _split_shooting_stat for the player stats table.
+    Unparseable values and DNP rows get NaN.
+    """
+    if df.empty:
+        return df
+
+    dnp = df["dnp"].to_numpy(dtype=bool) if "dnp" in df.columns else np.zeros(len(df), dtype=bool)
+
+    for stat in _SHOOTING_STATS:
+        if stat not in df.columns:
+            if dnp.any():
+                for suffix in ("MADE", "ATT", "PCT"):
+                    df[f"{stat}_{suffix}"] = np.nan
+            continue
+
+        # Non-string cells (e.g. a bare int) split to a single part and end up NaN
+        split = df[stat].astype('string').str.split('-', expand=True)
+        if split.shape[1] < 2:
+            split[1] = np.nan
+        made = pd.to_numeric(split[0], errors='coerce')
+        att = pd.to_numeric(split[1], errors='coerce')
+
+        valid = made.notna() & att.notna() & ~dnp
+        if split.shape[1] > 2:
+            # Values with more than one '-' are malformed
+            valid &= split[2].isna()
+        pct = (made / att.where(att > 0) * 100).round(1).fillna(0)
+
+        df[f"{stat}_MADE"] = made.where(valid).astype('float64')
+        df[f"{stat}_ATT"] = att.where(valid).astype('float64')
+        df[f"{stat}_PCT"] = pct.where(valid).astype('float64')
+
+    return df
+
+
 def _extract_team_stats(game_id: str, game_data: dict, game_details: dict) -> list:
     """Extract per-team aggregate statistics from boxscore data."""
     team_stats = []
@@ -631,25 +762,24 @@ def _extract_play_by_play(game_id: str, game_data: dict, teams_info: list, playe
         if not isinstance(play, dict):
             continue
 
-        period = play.get("period")
-        clock = play.get("clock")
-        team = play.get("team") if isinstance(play.get("team"), dict) else None
-        play_type = play.get("type") if isinstance(play.get("type"), dict) else None
+        period = _as_dict(play.get("period"))
+        team = _as_dict(play.get("team"))
+        play_type = _as_dict(play.get("type"))
 
-        clock_display = clock.get("displayValue") if isinstance(clock, dict) else None
+        clock_display = _as_dict(play.get("clock")).get("displayValue")
 
         play_info = {
             "game_id": game_id,
             "play_id": play.get("id"),
             "sequence_number": play.get("sequenceNumber"),
-            "period": period.get("number") if isinstance(period, dict) else None,
-            "period_display": period.get("displayValue") if isinstance(period, dict) else None,
+            "period": period.get("number"),
+            "period_display": period.get("displayValue"),
             "clock": clock_display,
-            "clock_seconds": convert_clock_to_seconds(clock_display or ""),
-            "team_id": team.get("id") if team else None,
-            "team_name": team.get("name") if team else None,
-            "play_type": play_type.get("text") if play_type else None,
-            "play_type_id": play_type.get("id") if play_type else None,
+            "clock_seconds": None,  # filled column-wise in process_game_data
+            "team_id": team.get("id"),
+            "team_name": team.get("name"),
+            "play_type": play_type.get("text"),
+            "play_type_id": play_type.get("id"),
             "text": play.get("text"),
             "score_home": play.get("homeScore"),
             "score_away": play.get("awayScore"),
@@ -678,8 +808,7 @@ def _extract_play_by_play(game_id: str, game_data: dict, teams_info: list, playe
         # Collect all player IDs from various sources
         player_ids = []
 
-        if isinstance(play.get('participantsCodes'), list):
-            player_ids.extend(play['participantsCodes'])
+        player_ids.extend(_as_list(play.get('participantsCodes')))
 
         for athlete in (play.get('athletesInvolved') or []):
             if isinstance(athlete, dict) and 'id' in athlete:
@@ -775,13 +904,10 @@ def process_game_data(game_id: str, season: int, verbose: bool = False) -> Dict[
         logger.debug(f"Game {game_id}: Top-level keys: {list(game_data.keys())}")
 
         # Extract all components
-        game_details = get_game_details(game_data, data_path)
+        broadcasts = get_broadcasts(game_data)
+        game_details = get_game_details(game_data, data_path, broadcasts)
 
         # Build game_info row
-        status = game_details["status"]
-        if isinstance(status, dict):
-            status = status.get("description") or status.get("short_detail") or status.get("name")
-
         game_info = {
             "game_id": game_id,
             "date": game_details["date"],
@@ -790,16 +916,16 @@ def process_game_data(game_id: str, season: int, verbose: bool = False) -> Dict[
             "venue_city": game_details["venue_city"],
             "venue_state": game_details["venue_state"],
             "attendance": game_details["attendance"],
-            "status": status if isinstance(status, str) else None,
+            "status": _resolve_status(game_details["status"]),
             "neutral_site": game_details["neutral_site"],
             "completed": game_details["completed"],
             "broadcast": game_details["broadcast"],
             "broadcast_market": game_details["broadcast_market"],
             "broadcast_type": game_details["broadcast_type"],
-            "regulation_clock": game_details.get("regulation_clock", 600.0),
-            "overtime_clock": game_details.get("overtime_clock", 300.0),
-            "period_name": game_details.get("period_name", "Quarter"),
-            "num_periods": game_details.get("num_periods", 4),
+            "regulation_clock": game_details["regulation_clock"],
+            "overtime_clock": game_details["overtime_clock"],
+            "period_name": game_details["period_name"],
+            "num_periods": game_details["num_periods"],
             "boxscore_source": game_details["boxscore_source"],
             "boxscore_available": game_details["boxscore_available"],
             "play_by_play_source": game_details["play_by_play_source"],
@@ -811,23 +937,27 @@ def process_game_data(game_id: str, season: int, verbose: bool = False) -> Dict[
 
         teams_info = _extract_teams_info(game_id, game_details)
         officials_data = _extract_officials(game_id, game_data)
-        broadcasts_data = _extract_broadcasts(game_id, game_data)
+        broadcasts_data = _extract_broadcasts(game_id, broadcasts)
         player_stats = _extract_player_stats(game_id, game_data)
         team_stats = _extract_team_stats(game_id, game_data, game_details)
         play_by_play = _extract_play_by_play(game_id, game_data, teams_info, player_stats)
 
+        play_by_play_df = pd.DataFrame(play_by_play)
+        if not play_by_play_df.empty:
+            play_by_play_df["clock_seconds"] = _clock_column_to_seconds(play_by_play_df["clock"])
+
         result = {
             "game_id": game_id,
             "season": season,
             "processed": True,
             "data": {
                 "game_info": pd.DataFrame([game_info]) if game_info else pd.DataFrame(),
-                "teams_info": pd.DataFrame(teams_info) if teams_info else pd.DataFrame(),
-                "player_stats": pd.DataFrame(player_stats) if player_stats else pd.DataFrame(),
+                "teams_info": _records_to_frame(teams_info),
+                "player_stats": _split_shooting_columns(pd.DataFrame(player_stats)) if player_stats else pd.DataFrame(),
                 "team_stats": pd.DataFrame(team_stats) if team_stats else pd.DataFrame(),
-                "play_by_play": pd.DataFrame(play_by_play) if play_by_play else pd.DataFrame(),
-                "officials": pd.DataFrame(officials_data) if officials_data else pd.DataFrame(),
-                "broadcasts": pd.DataFrame(broadcasts_data) if broadcasts_data else pd.DataFrame(),
+                "play_by_play": play_by_play_df,
+                "officials": _records_to_frame(officials_data),
+                "broadcasts": _records_to_frame(broadcasts_data),
             }
         }
 
@@ -854,6 +984,27 @@ def process_game_with_season(game_id, season, force, gender=None, data_dir=None,
         return {"game_id": game_id, "season": season, "processed": False, "error": f"Error: {e}"}
 
 
+def _process_game_chunk(game_ids, season, force, gender=None, data_dir=None, verbose=False):
+    """Helper for multiprocessing: process a batch of games serially in one worker.
+
+    Returns ``(summary, data)``: one (game_id, season, processed, error) tuple per
+    game, and the batch's non-empty DataFrames grouped by data type.
+    """
+    summary = []
+    data = {}
+    for gid in game_ids:
+        result = process_game_with_season(gid, season, force, gender, data_dir, verbose)
+        if result.get("processed") and "data" in result:
+            summary.append((result["game_id"], result.get("season", season), True, None))
+            for dt, df in result["data"].items():
+                if not df.empty:
+                    data.setdefault(dt, []).append(df)
+        else:
+            summary.append((result["game_id"], result.get("season", season), False,
+                            result.get("error", "Unknown error")))
+    return summary, data
+
+
 # ---------------------------------------------------------------------------
 # DataFrame optimization
 # ---------------------------------------------------------------------------
@@ -870,16 +1021,19 @@ _CATEGORICAL_COLUMNS = [
     "team_abbreviation", "position", "status", "play_type",
 ]
 
-# Per-datatype column type overrides
+# Per-datatype column type overrides — the fixed target schema for each table.
+# Applied directly by name; only the generic ID/categorical passes inspect values.
+# Scores, clock, jersey and season are Int16; attendance is Int32.
 _DTYPE_OVERRIDES = {
     "broadcasts": {},
     "game_info": {
-        "attendance": "Int64",
+        "attendance": "Int32",
         "date": "datetime64[ns]",
         "neutral_site": "bool",
         "completed": "bool",
     },
     "game_summary": {
+        "season": "Int16",
         "error": "categorical",
         "processed": "bool",
     },
@@ -890,10 +1044,10 @@ _DTYPE_OVERRIDES = {
     },
     "play_by_play": {
         "play_id": False,  # Don't convert — may be too large
-        "clock_seconds": "Int64",
-        "score_home": "Int64",
-        "score_away": "Int64",
-        "score_value": "Int64",
+        "clock_seconds": "Int16",
+        "score_home": "Int16",
+        "score_away": "Int16",
+        "score_value": "Int16",
         "coordinate_x": "float64",
         "coordinate_y": "float64",
         "home_win_percentage": "float64",
@@ -903,7 +1057,7 @@ _DTYPE_OVERRIDES = {
         "wallclock": "datetime64[ns]",
     },
     "player_stats": {
-        "jersey": "Int64",
+        "jersey": "Int16",
         "MIN": "float64",
         "OREB": "float64",
         "DREB": "float64",
@@ -921,7 +1075,7 @@ _DTYPE_OVERRIDES = {
         "dnp": "bool",
     },
     "schedules": {
-        "season": "Int64",
+        "season": "Int16",
         "event_date": "datetime64[ns]",
     },
     "team_stats": {
@@ -949,7 +1103,7 @@ _DTYPE_OVERRIDES = {
         "conference_id": "Int64",
     },
     "teams_info": {
-        "score": "Int64",
+        "score": "Int16",
         "winner": "bool",
         "team_color": "categorical",
         "team_location": "categorical",
@@ -958,23 +1112,31 @@ _DTYPE_OVERRIDES = {
     },
 }
 
+# Raw values accepted for "bool" overrides; anything else becomes missing
+_TRUE_VALUES = np.array([True, 'True', 'true', 1, '1'], dtype=object)
+_FALSE_VALUES = np.array([False, 'False', 'false', 0, '0'], dtype=object)
+
 
 def _convert_column(df, col, dtype):
     """Convert a single DataFrame column to the target dtype."""
     try:
-        if dtype == "Int64":
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+        if dtype in ("Int64", "Int32", "Int16"):
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
         elif dtype == "datetime64[ns]":
             df[col] = pd.to_datetime(df[col], errors='coerce')
         elif dtype == "categorical":
-            if df[col].nunique() < 100:
-                df[col] = df[col].astype('category')
+            # Declared in _DTYPE_OVERRIDES, so cast without a cardinality probe
+            df[col] = df[col].astype('category')
         elif dtype == "bool":
-            if df[col].dtype != 'bool':
-                df[col] = df[col].map({
-                    True: True, 'True': True, 'true': True, 1: True, '1': True,
-                    False: False, 'False': False, 'false': False, 0: False, '0': False,
-                }).astype('bool')
+            # Already-nullable boolean columns are left as they are
+            if df[col].dtype != 'bool' and not isinstance(df[col].dtype, pd.BooleanDtype):
+                # Series.isin hashes values, so pd.NA/None/NaN simply don't match
+                true_mask = df[col].isin(_TRUE_VALUES).to_numpy()
+                known = true_mask | df[col].isin(_FALSE_VALUES).to_numpy()
+                if known.all():
+                    df[col] = true_mask
+                else:
+                    df[col] = pd.array(np.where(known, true_mask, pd.NA), dtype='boolean')
         elif dtype == "float64":
             df[col] = pd.to_numeric(df[col], errors='coerce')
         else:
@@ -993,8 +1155,7 @@ def optimize_dataframe_dtypes(df: pd.DataFrame, data_type: str) -> pd.DataFrame:
     # Convert ID columns to nullable integer
     for col in _ID_COLUMNS:
         if col in result_df.columns and result_df[col].dtype == 'object':
-            non_null = result_df[col].dropna()
-            if len(non_null) > 0:
+            if result_df[col].notna().any():
                 _convert_column(result_df, col, "Int64")
 
     # Convert common categorical columns
@@ -1006,21 +1167,6 @@ def optimize_dataframe_dtypes(df: pd.DataFrame, data_type: str) -> pd.DataFrame:
                 except Exception as e:
                     logger.warning(f"Error converting {col} to categorical: {e}")
 
-    # Extract format components for game_info
-    if data_type == "game_info" and "format" in result_df.columns:
-        try:
-            if result_df["format"].dtype == 'object':
-                result_df["regulation_clock"] = result_df["format"].apply(
-                    lambda x: x.get("regulation", {}).get("clock") if isinstance(x, dict) else None)
-                result_df["overtime_clock"] = result_df["format"].apply(
-                    lambda x: x.get("overtime", {}).get("clock") if isinstance(x, dict) else None)
-                result_df["period_name"] = result_df["format"].apply(
-                    lambda x: x.get("regulation", {}).get("displayName") if isinstance(x, dict) else None)
-                result_df["num_periods"] = result_df["format"].apply(
-                    lambda x: x.get("regulation", {}).get("periods") if isinstance(x, dict) else None)
-        except Exception as e:
-            logger.warning(f"Error processing format column: {e}")
-
     # Apply per-datatype overrides
     overrides = _DTYPE_OVERRIDES.get(data_type, {})
     for col, dtype in overrides.items():
@@ -1030,15 +1176,20 @@ def optimize_dataframe_dtypes(df: pd.DataFrame, data_type: str) -> pd.DataFrame:
     # Replace empty strings with NaN in object columns
     for col in result_df.columns:
         if result_df[col].dtype == 'object':
-            result_df[col] = result_df[col].replace('', np.nan)
+            # eq() is NA-safe; a raw ndarray == '' raises on pd.NA
+            empty = result_df[col].eq('').to_numpy(dtype=bool, na_value=False)
+            if empty.any():
+                values = result_df[col].to_numpy(copy=True)
+                values[empty] = np.nan
+                result_df[col] = values
 
     # Player stats: ensure DNP players have null stats, convert string stats to numeric
     if data_type == "player_stats" and "dnp" in result_df.columns:
-        dnp_mask = result_df["dnp"] == True
+        dnp_mask = result_df["dnp"].eq(True).to_numpy(dtype=bool, na_value=False)
         if dnp_mask.any():
             for col in _DNP_STAT_FIELDS:
                 if col in result_df.columns:
-                    result_df.loc[dnp_mask, col] = np.nan
+                    result_df[col] = result_df[col].mask(dnp_mask)
 
         for col in ["OREB", "DREB", "REB", "AST", "STL", "BLK", "TO", "PF", "PTS"]:
             if col in result_df.columns and result_df[col].dtype == 'object':
@@ -1052,24 +1203,25 @@ def remove_redundant_columns(df: pd.DataFrame, data_type: str) -> pd.DataFrame:
     if df.empty:
         return df
 
-    result_df = df.copy()
+    to_drop = []
 
     # Remove string shooting stat columns when parsed versions exist
     if data_type in ["player_stats", "team_stats"]:
+        groups = {}
         for str_col in _SHOOTING_STATS:
             parsed_cols = [f"{str_col}_MADE", f"{str_col}_ATT", f"{str_col}_PCT"]
-            if str_col in result_df.columns and all(c in result_df.columns for c in parsed_cols):
-                if result_df[parsed_cols].notna().all(axis=1).mean() > 0.9:
-                    result_df = result_df.drop(columns=[str_col])
+            if str_col in df.columns and all(c in df.columns for c in parsed_cols):
+                groups[str_col] = parsed_cols
 
-    # Remove raw format column if components were extracted
-    if data_type == "game_info" and "format" in result_df.columns:
-        extracted = ["regulation_clock", "overtime_clock", "period_name", "num_periods"]
-        if all(c in result_df.columns for c in extracted):
-            if result_df[extracted].notna().any(axis=1).mean() > 0.9:
-                result_df = result_df.drop(columns=["format"])
+        if groups:
+            # One notna pass over every parsed column, then slice per stat
+            all_parsed = [c for cols in groups.values() for c in cols]
+            notna = df[all_parsed].notna().to_numpy()
+            for i, str_col in enumerate(groups):
+                if notna[:, 3 * i:3 * i + 3].all(axis=1).mean() > 0.9:
+                    to_drop.append(str_col)
 
-    return result_df
+    return df.drop(columns=to_drop) if to_drop else df
 
 
 # ---------------------------------------------------------------------------
@@ -1077,8 +1229,13 @@ def remove_redundant_columns(df: pd.DataFrame, data_type: str) -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 
 def process_all_games(season: int, max_workers: int = 4, force: bool = False,
-                      verbose: bool = False) -> Dict[str, pd.DataFrame]:
-    """Process all games for a season and save consolidated data files."""
+                      verbose: bool = False,
+                      scheduled_game_ids: Optional[set] = None) -> Dict[str, pd.DataFrame]:
+    """Process all games for a season and save consolidated data files.
+
+    Pass ``scheduled_game_ids`` (from the season's schedules) to reconcile
+    game_summary without re-reading schedules.parquet.
+    """
     logger.info(f"Processing games for season {season}")
 
     raw_games_dir = get_games_dir(season)
@@ -1086,57 +1243,81 @@ def process_all_games(season: int, max_workers: int = 4, force: bool = False,
         logger.warning(f"No raw game data found for season {season}")
         return {"game_summary": pd.DataFrame()}
 
-    game_files = [f for f in os.listdir(raw_games_dir) if f.endswith('.json')]
-    game_ids = [os.path.splitext(f)[0] for f in game_files]
+    csv_season_dir = get_csv_season_dir(season)
+    parquet_season_dir = get_parquet_season_dir(season)
+    schedules_file = parquet_season_dir / "schedules.parquet"
+
+    with os.scandir(raw_games_dir) as entries:
+        game_ids = [entry.name[:-5] for entry in entries if entry.name.endswith('.json')]
     logger.info(f"Found {len(game_ids)} games to process for season {season}")
 
     # Collect results by data type
     data_type_names = ["game_info", "teams_info", "player_stats", "team_stats",
                        "play_by_play", "officials", "broadcasts"]
     game_results = {dt: [] for dt in data_type_names}
-    game_summary = []
+    # game_summary columns, accumulated in parallel
+    gs_ids, gs_seasons, gs_processed, gs_errors = [], [], [], []
+
+    def add_summary(game_id, game_season, processed, error):
+        gs_ids.append(game_id)
+        gs_seasons.append(game_season)
+        gs_processed.append(processed)
+        gs_errors.append(error)
 
     cfg = get_config()
     logger.info(f"Processing games with gender: {cfg.gender}")
 
+    # Submit games in batches to amortize IPC, keeping enough batches to feed every worker
+    chunk_size = max(1, min(_GAME_CHUNK_SIZE, len(game_ids) // (max_workers * 4)))
+    chunks = [game_ids[i:i + chunk_size] for i in range(0, len(game_ids), chunk_size)]
+
     with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(process_game_with_season, gid, season, force,
-                            cfg.gender, str(cfg.data_dir), verbose)
-            for gid in game_ids
-        ]
+        futures = {
+            executor.submit(_process_game_chunk, chunk, season, force,
+                            cfg.gender, str(cfg.data_dir), verbose): chunk
+            for chunk in chunks
+        }
 
         for future in as_completed(futures):
             try:
-                result = future.result()
+                summary, data = future.result()
             except Exception as e:
                 logger.error(f"Error processing game result: {e}")
-                game_summary.append({
-                    "game_id": "error", "season": season,
-                    "processed": False, "error": str(e),
-                })
+                for gid in futures[future]:
+                    add_summary(gid, season, False, str(e))
                 continue
 
-            if result.get("processed") and "data" in result:
-                game_summary.append({
-                    "game_id": result["game_id"], "season": result.get("season", season),
-                    "processed": True, "error": None,
-                })
-                for dt, df in result["data"].items():
-                    if not df.empty:
-                        game_results[dt].append(df)
-            else:
-                game_summary.append({
-                    "game_id": result["game_id"], "season": result.get("season", season),
-                    "processed": False, "error": result.get("error", "Unknown error"),
-                })
+            for row in summary:
+                add_summary(*row)
+            for dt, dfs in data.items():
+                game_results[dt].extend(dfs)
 
     # Combine all results into consolidated DataFrames
     combined_dfs = {}
 
+    # Reconcile game_summary with schedules if available, before building the frame
+    if gs_ids:
+        try:
+            if scheduled_game_ids is None and schedules_file.exists():
+                schedules_df = pd.read_parquet(schedules_file, columns=['game_id'])
+                scheduled_game_ids = set(schedules_df['game_id'].unique())
+            if scheduled_game_ids:
+                # Scheduled ids are integers; summary ids are still raw strings here
+                processed_ids = set(pd.to_numeric(pd.Series(gs_ids), errors='coerce').dropna())
+                missing_ids = scheduled_game_ids - processed_ids
+                if missing_ids:
+                    logger.warning(f"Found {len(missing_ids)} games in schedule not in game_summary")
+                    for gid in missing_ids:
+                        add_summary(gid, season, False, "Game failed to process completely")
+        except Exception as e:
+            logger.error(f"Error reconciling game_summary with schedules: {e}")
+
     # Game summary
-    if game_summary:
-        summary_df = pd.DataFrame(game_summary)
+    if gs_ids:
+        summary_df = pd.DataFrame({
+            "game_id": gs_ids, "season": gs_seasons,
+            "processed": gs_processed, "error": gs_errors,
+        })
         if 'error' in summary_df.columns:
             summary_df['error'] = summary_df['error'].replace('', None)
         combined_dfs["game_summary"] = optimize_dataframe_dtypes(summary_df, "game_summary")
@@ -1153,11 +1334,12 @@ def process_all_games(season: int, max_workers: int = 4, force: bool = False,
         try:
             non_empty = [df for df in df_list if not df.empty]
             if non_empty:
-                # Drop all-NA columns before concat
-                cleaned = [df.dropna(axis=1, how='all') for df in non_empty]
+                # Keep only each frame's non-null columns so all-NA columns don't
+                # take part in concat's dtype resolution
+                cleaned = [df.loc[:, df.notna().any()] for df in non_empty]
                 cleaned = [df for df in cleaned if not df.empty]
-                if cleaned:
-                    combined_df = pd.concat(cleaned, ignore_index=True)
+                combined_df = pd.concat(cleaned, ignore_index=True) if cleaned else pd.DataFrame()
+                if not combined_df.empty:
                     combined_df = optimize_dataframe_dtypes(combined_df, dt)
                     combined_df = remove_redundant_columns(combined_df, dt)
                     combined_dfs[dt] = combined_df
@@ -1171,37 +1353,16 @@ def process_all_games(season: int, max_workers: int = 4, force: bool = False,
             combined_dfs[dt] = pd.DataFrame()
 
     # Save to disk
-    csv_season_dir = get_csv_season_dir(season)
-    parquet_season_dir = get_parquet_season_dir(season)
-    os.makedirs(csv_season_dir, exist_ok=True)
     os.makedirs(parquet_season_dir, exist_ok=True)
+    if cfg.write_csv:
+        os.makedirs(csv_season_dir, exist_ok=True)
 
     for dt, df in combined_dfs.items():
         if df.empty:
             continue
         try:
-            # Reconcile game_summary with schedules if available
-            if dt == "game_summary":
-                try:
-                    schedules_file = parquet_season_dir / "schedules.parquet"
-                    if schedules_file.exists():
-                        schedules_df = pd.read_parquet(schedules_file)
-                        if not schedules_df.empty and 'game_id' in schedules_df.columns:
-                            scheduled_ids = set(schedules_df['game_id'].unique())
-                            processed_ids = set(df['game_id'].unique())
-                            missing_ids = scheduled_ids - processed_ids
-                            if missing_ids:
-                                logger.warning(f"Found {len(missing_ids)} games in schedule not in game_summary")
-                                missing = pd.DataFrame([{
-                                    "game_id": gid, "season": season,
-                                    "processed": False, "error": "Game failed to process completely",
-                                } for gid in missing_ids])
-                                df = pd.concat([df, missing], ignore_index=True)
-                except Exception as e:
-                    logger.error(f"Error reconciling game_summary with schedules: {e}")
-
-            df.to_csv(csv_season_dir / f"{dt}.csv", index=False)
-            df.to_parquet(parquet_season_dir / f"{dt}.parquet", index=False)
+            row_group_size = _PBP_ROW_GROUP_SIZE if dt == "play_by_play" else None
+            _save_table(df, csv_season_dir / f"{dt}.csv", parquet_season_dir / f"{dt}.parquet", row_group_size)
             logger.info(f"Saved {dt} with {len(df)} rows")
         except Exception as e:
             logger.error(f"Error saving {dt} files: {e}")
@@ -1212,8 +1373,7 @@ def process_all_games(season: int, max_workers: int = 4, force: bool = False,
         try:
             from espn_data.game_control import compute_game_metrics
             gc_df = compute_game_metrics(pbp_df)
-            gc_df.to_csv(csv_season_dir / "game_control.csv", index=False)
-            gc_df.to_parquet(parquet_season_dir / "game_control.parquet", index=False)
+            _save_table(gc_df, csv_season_dir / "game_control.csv", parquet_season_dir / "game_control.parquet")
             combined_dfs["game_control"] = gc_df
             logger.info(f"Saved game_control with {len(gc_df)} rows")
         except Exception as e:
@@ -1228,10 +1388,12 @@ def process_schedules(season: int, force: bool = False) -> pd.DataFrame:
 
     csv_season_dir = get_csv_season_dir(season)
     csv_schedules_file = csv_season_dir / "schedules.csv"
+    parquet_season_dir = get_parquet_season_dir(season)
+    parquet_schedules_file = parquet_season_dir / "schedules.parquet"
 
-    if not force and csv_schedules_file.exists():
+    if not force and parquet_schedules_file.exists():
         logger.info(f"Using cached schedules for season {season}")
-        return pd.read_csv(csv_schedules_file, parse_dates=['event_date'])
+        return pd.read_parquet(parquet_schedules_file, engine='pyarrow')
 
     regular_dir = get_schedules_dir(season)
     postseason_dir = get_schedules_dir(season, schedule_type="postseason")
@@ -1258,16 +1420,6 @@ def process_schedules(season: int, force: bool = False) -> pd.DataFrame:
             event_id = event.get("id")
             event_date = event.get("date")
 
-            if event_date:
-                try:
-                    dt = pd.to_datetime(event_date, errors='coerce')
-                    if pd.notna(dt):
-                        event_date = dt
-                    else:
-                        event_date = datetime.fromisoformat(event_date.replace('Z', '+00:00'))
-                except (ValueError, TypeError):
-                    logger.debug(f"Could not parse date {event_date} for event {event_id}")
-
             for competition in event.get("competitions", []):
                 game_id = competition.get("id")
                 for team_data in competition.get("competitors", []):
@@ -1283,6 +1435,10 @@ def process_schedules(season: int, force: bool = False) -> pd.DataFrame:
                         })
 
     schedules_df = pd.DataFrame(all_games)
+    if 'event_date' in schedules_df.columns:
+        # Parse all raw ISO-8601 date strings in one pass
+        schedules_df['event_date'] = pd.to_datetime(
+            schedules_df['event_date'], utc=True, errors='coerce', format='ISO8601')
     schedules_df = optimize_dataframe_dtypes(schedules_df, "schedules")
 
     if 'event_date' in schedules_df.columns and schedules_df['event_date'].dtype != 'datetime64[ns]':
@@ -1291,13 +1447,12 @@ def process_schedules(season: int, force: bool = False) -> pd.DataFrame:
         except Exception as e:
             logger.warning(f"Error converting event_date to datetime: {e}")
 
-    parquet_season_dir = get_parquet_season_dir(season)
-    os.makedirs(csv_season_dir, exist_ok=True)
     os.makedirs(parquet_season_dir, exist_ok=True)
+    if get_config().write_csv:
+        os.makedirs(csv_season_dir, exist_ok=True)
 
     try:
-        schedules_df.to_csv(csv_schedules_file, index=False)
-        schedules_df.to_parquet(parquet_season_dir / "schedules.parquet", index=False)
+        _save_table(schedules_df, csv_schedules_file, parquet_schedules_file)
         logger.info(f"Saved schedules for season {season} with {len(schedules_df)} games")
     except Exception as e:
         logger.error(f"Error saving schedules for season {season}: {e}")
@@ -1311,8 +1466,9 @@ def process_season_data(season: int, max_workers: int = 4, force: bool = False,
     logger.info(f"Processing data for season {season}")
 
     try:
-        os.makedirs(get_csv_season_dir(season), exist_ok=True)
         os.makedirs(get_parquet_season_dir(season), exist_ok=True)
+        if get_config().write_csv:
+            os.makedirs(get_csv_season_dir(season), exist_ok=True)
     except Exception as e:
         logger.error(f"Error creating directories for season {season}: {e}")
         return {"season": season, "total_games": 0, "success_games": 0, "error_games": 0, "error": str(e)}
@@ -1322,14 +1478,16 @@ def process_season_data(season: int, max_workers: int = 4, force: bool = False,
         logger.warning(f"No schedule data found for season {season}")
         return {"season": season, "total_games": 0, "success_games": 0, "error_games": 0, "error": "No schedule data"}
 
-    total_games = len(schedules_df['game_id'].unique())
+    scheduled_game_ids = set(schedules_df['game_id'].unique())
+    total_games = len(scheduled_game_ids)
     logger.info(f"Processing {total_games} games for season {season}")
 
     success_count = 0
     error_count = 0
 
     try:
-        processed_data = process_all_games(season, max_workers=max_workers, force=force, verbose=verbose)
+        processed_data = process_all_games(season, max_workers=max_workers, force=force, verbose=verbose,
+                                           scheduled_game_ids=scheduled_game_ids)
 
         for name, df in processed_data.items():
             if not df.empty and name == 'game_summary' and 'processed' in df.columns:
@@ -1354,9 +1512,10 @@ def process_season_data(season: int, max_workers: int = 4, force: bool = False,
 def process_all_data(seasons: Optional[List[int]] = None, max_workers: int = 4,
                      gender: str = None, data_dir: Union[str, Path] = None,
                      game_ids: Optional[List[str]] = None,
-                     force: bool = False, verbose: bool = False) -> None:
+                     force: bool = False, verbose: bool = False,
+                     write_csv: Optional[bool] = None) -> None:
     """Process all data for the specified seasons."""
-    configure(gender=gender, data_dir=data_dir)
+    configure(gender=gender, data_dir=data_dir, write_csv=write_csv)
 
     logger.info(f"Processing all data for {get_current_gender()} basketball")
 
@@ -1382,19 +1541,32 @@ def process_all_data(seasons: Optional[List[int]] = None, max_workers: int = 4,
                 logger.info(f"Processing only specific games: {', '.join(game_ids)}")
                 games_dir = get_games_dir(season)
 
-                game_results = {}
-                for gid in game_ids:
-                    game_file = games_dir / f"{gid}.json"
-                    if game_file.exists():
+                available_ids = [gid for gid in game_ids if (games_dir / f"{gid}.json").exists()]
+                cfg = get_config()
+
+                results_by_id = {}
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(process_game_with_season, gid, season, force,
+                                        cfg.gender, str(cfg.data_dir), verbose): gid
+                        for gid in available_ids
+                    }
+                    for future in as_completed(futures):
+                        gid = futures[future]
                         try:
-                            result = process_game_data(gid, season)
-                            if result.get("processed"):
-                                game_results[gid] = result
-                            else:
-                                summary['error_games'] += 1
+                            result = future.result()
                         except Exception as e:
                             logger.error(f"Error processing game {gid}: {e}")
                             summary['error_games'] += 1
+                            continue
+
+                        if result.get("processed"):
+                            results_by_id[gid] = result
+                        else:
+                            summary['error_games'] += 1
+
+                # Keep the requested game order regardless of completion order
+                game_results = {gid: results_by_id[gid] for gid in available_ids if gid in results_by_id}
 
                 if game_results:
                     # Consolidate results from individual games
@@ -1403,8 +1575,9 @@ def process_all_data(seasons: Optional[List[int]] = None, max_workers: int = 4,
 
                     season_dir_csv = get_csv_season_dir(season)
                     season_dir_parquet = get_parquet_season_dir(season)
-                    os.makedirs(season_dir_csv, exist_ok=True)
                     os.makedirs(season_dir_parquet, exist_ok=True)
+                    if cfg.write_csv:
+                        os.makedirs(season_dir_csv, exist_ok=True)
 
                     for dt in data_types:
                         dfs = [r["data"][dt] for r in game_results.values()
@@ -1413,8 +1586,9 @@ def process_all_data(seasons: Optional[List[int]] = None, max_workers: int = 4,
                             combined = pd.concat(dfs, ignore_index=True)
                             combined = optimize_dataframe_dtypes(combined, dt)
                             combined = remove_redundant_columns(combined, dt)
-                            combined.to_csv(season_dir_csv / f"{dt}.csv", index=False)
-                            combined.to_parquet(season_dir_parquet / f"{dt}.parquet", index=False)
+                            row_group_size = _PBP_ROW_GROUP_SIZE if dt == "play_by_play" else None
+                            _save_table(combined, season_dir_csv / f"{dt}.csv",
+                                        season_dir_parquet / f"{dt}.parquet", row_group_size)
 
                     summary['success_games'] += len(game_results)
                     summary['total_games'] += len(game_ids)
@@ -1457,10 +1631,12 @@ def main() -> None:
     parser.add_argument("--output-dir", "-o", type=str,
                         help="Output data directory (default: data/)")
     parser.add_argument("--force", "-f", action="store_true", help="Force reprocessing even if files exist locally")
+    parser.add_argument("--csv", action="store_true", help="Also write CSV copies of processed tables")
     args = parser.parse_args()
 
     process_all_data(seasons=args.seasons, max_workers=args.max_workers,
-                     gender=args.gender, data_dir=args.output_dir, force=args.force)
+                     gender=args.gender, data_dir=args.output_dir, force=args.force,
+                     write_csv=args.csv)
 
 
 if __name__ == "__main__":
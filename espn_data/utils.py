@@ -1,11 +1,11 @@
 """Utility functions for ESPN data scraping."""
 
 import os
-import json
 import time
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+import orjson
 import requests
 from typing import Dict, Any, Optional, Union
 
@@ -50,6 +50,7 @@ class Config:
     """Central configuration — set once at program start, read everywhere."""
     gender: str = "womens"
     data_dir: Path = field(default_factory=lambda: PROJECT_ROOT / "data")
+    write_csv: bool = False  # Parquet is always written; CSV export is opt-in
 
     def __post_init__(self):
         if self.gender not in ("mens", "womens"):
@@ -60,7 +61,7 @@ class Config:
 _config = Config()
 
 
-def configure(gender: str = None, data_dir: Union[str, Path] = None) -> None:
+def configure(gender: str = None, data_dir: Union[str, Path] = None, write_csv: bool = None) -> None:
     """Set global configuration. Call once at program start."""
     if gender is not None:
         if gender not in ("mens", "womens"):
@@ -68,6 +69,8 @@ def configure(gender: str = None, data_dir: Union[str, Path] = None) -> None:
         _config.gender = gender
     if data_dir is not None:
         _config.data_dir = Path(data_dir)
+    if write_csv is not None:
+        _config.write_csv = write_csv
 
 
 def get_config() -> Config:
@@ -188,8 +191,9 @@ def ensure_dirs():
     for gender in ("mens", "womens"):
         for subdir in ("raw", "processed"):
             os.makedirs(d / subdir / gender, exist_ok=True)
-        for fmt in ("csv", "parquet"):
-            os.makedirs(d / "processed" / gender / fmt, exist_ok=True)
+        os.makedirs(d / "processed" / gender / "parquet", exist_ok=True)
+        if _config.write_csv:
+            os.makedirs(d / "processed" / gender / "csv", exist_ok=True)
 
 ensure_dirs()
 
@@ -225,8 +229,7 @@ def save_json(data: Any, file_path: Union[str, Path]) -> None:
     """Save data as JSON to the specified file path."""
     file_path = Path(file_path)
     os.makedirs(file_path.parent, exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     logger.info(f"Data saved to {file_path}")
 
 
@@ -236,8 +239,7 @@ def load_json(file_path: Union[str, Path]) -> Any:
     if not file_path.exists():
         logger.warning(f"File not found: {file_path}")
         return None
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return orjson.loads(file_path.read_bytes())
 
 
 # ---------------------------------------------------------------------------
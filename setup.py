@@ -11,10 +11,12 @@ setup(
     install_requires=[
         "requests>=2.31.0",
         "pandas>=2.1.1",
+        "pyarrow>=14.0.1",
         "tqdm>=4.66.1",
         "python-dotenv>=1.0.0",
         "aiohttp>=3.8.5",
         "asyncio>=3.4.3",
+        "orjson>=3.9.0",
     ],
     entry_points={
         "console_scripts": ["espn-scraper=espn_data.__main__:main",],
@@ -20,13 +20,19 @@ import pandas as pd
 import numpy as np
 from espn_data.processor import (
     get_game_details,
+    process_teams_data,
     convert_clock_to_seconds,
     get_broadcasts,
     get_primary_broadcast,
     optimize_dataframe_dtypes,
     remove_redundant_columns,
+    _split_shooting_columns,
+    _clock_column_to_seconds,
+    _save_table,
+    _convert_column,
+    _records_to_frame,
 )
-from espn_data.utils import set_gender, get_games_dir
+from espn_data.utils import set_gender, get_games_dir, configure, get_config, save_json, get_teams_file
 
 EXAMPLE_DIR = os.path.join(os.path.dirname(__file__), '..', 'example_data')
 SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), 'golden_snapshots')
@@ -212,6 +218,179 @@ class TestConvertClockToSeconds:
         assert convert_clock_to_seconds("30") is None
 
 
+class TestClockColumnToSeconds:
+    @pytest.mark.parametrize("clocks", [
+        pd.Series(["10:00", "0:00", "5:30", "1:05", None, "", 123, "abc", "30"], dtype=object),
+        pd.Series([5, 6]),  # no strings at all
+    ])
+    def test_matches_scalar_conversion(self, clocks):
+        result = _clock_column_to_seconds(clocks)
+        for value, expected in zip(result, clocks):
+            scalar = convert_clock_to_seconds(expected)
+            if scalar is None:
+                assert pd.isna(value)
+            else:
+                assert value == scalar
+
+    def test_all_valid_is_integer(self):
+        result = _clock_column_to_seconds(pd.Series(["10:00", "0:59"]))
+        assert result.dtype == 'int64'
+        assert result.tolist() == [600, 59]
+
+
+class TestSplitShootingColumns:
+    def test_splits_made_attempted(self):
+        df = pd.DataFrame({'dnp': [False, False], 'FG': ['7-15', '0-0']})
+        result = _split_shooting_columns(df)
+        assert result['FG_MADE'].tolist() == [7.0, 0.0]
+        assert result['FG_ATT'].tolist() == [15.0, 0.0]
+        assert result['FG_PCT'].tolist() == [46.7, 0.0]
+
+    def test_invalid_and_dnp_rows_are_nan(self):
+        df = pd.DataFrame({'dnp': [False, True, False], 'FG': ['--', '3-4', None]})
+        result = _split_shooting_columns(df)
+        assert result['FG_MADE'].isna().all()
+        assert result['FG_PCT'].isna().all()
+
+    def test_malformed_value_does_not_affect_other_rows(self):
+        df = pd.DataFrame({'dnp': [False, False], 'FT': ['1-2-3', '4-5']})
+        result = _split_shooting_columns(df)
+        assert np.isnan(result['FT_MADE'][0])
+        assert result['FT_MADE'][1] == 4.0
+        assert result['FT_PCT'][1] == 80.0
+
+    def test_non_string_column_is_nan(self):
+        df = pd.DataFrame({'dnp': [False], 'FG': [7]})
+        result = _split_shooting_columns(df)
+        assert result['FG_MADE'].isna().all()
+        assert result['FG_PCT'].isna().all()
+
+    def test_missing_column_with_dnp(self):
+        df = pd.DataFrame({'dnp': [True]})
+        result = _split_shooting_columns(df)
+        assert '3PT_MADE' in result.columns
+        assert result['3PT_MADE'].isna().all()
+
+
+class TestRecordsToFrame:
+    def test_keeps_every_key_in_first_seen_order(self):
+        records = [{'game_id': 1, 'score': 70}, {'game_id': 1, 'score': 65, 'linescores': '30,35'}]
+        result = _records_to_frame(records)
+        assert list(result.columns) == ['game_id', 'score', 'linescores']
+        assert result['linescores'].isna().tolist() == [True, False]
+
+    def test_empty_records(self):
+        assert _records_to_frame([]).empty
+
+
+class TestOptimizeEmptyStrings:
+    def test_empty_strings_become_nan_with_pd_na_present(self):
+        df = pd.DataFrame({'other': ['', pd.NA, 'y']}, dtype=object)
+        result = optimize_dataframe_dtypes(df, 'broadcasts')
+        assert result['other'].isna().tolist() == [True, True, False]
+        assert result['other'][2] == 'y'
+
+
+class TestOptimizeIntWidths:
+    def test_overrides_set_narrow_widths(self):
+        df = pd.DataFrame({'score_home': ['0', '88', None], 'clock_seconds': [0, 1200, 90]})
+        result = optimize_dataframe_dtypes(df, 'play_by_play')
+        assert result['score_home'].dtype == 'Int16'
+        assert result['clock_seconds'].dtype == 'Int16'
+        assert result['score_home'].isna().tolist() == [False, False, True]
+
+    def test_id_columns_stay_int64(self):
+        df = pd.DataFrame({'game_id': ['1', '2'], 'play_type_id': ['5', '6']})
+        result = optimize_dataframe_dtypes(df, 'play_by_play')
+        assert result['game_id'].dtype == 'Int64'
+        assert result['play_type_id'].dtype == 'Int64'
+
+
+class TestConvertColumnBool:
+    def test_recognised_values_stay_numpy_bool(self):
+        df = pd.DataFrame({'flag': [True, 'false', 1, '0']})
+        _convert_column(df, 'flag', 'bool')
+        assert df['flag'].dtype == 'bool'
+        assert df['flag'].tolist() == [True, False, True, False]
+
+    def test_unrecognised_and_nan_become_na(self):
+        df = pd.DataFrame({'flag': [True, 'x', None, np.nan, 0]})
+        _convert_column(df, 'flag', 'bool')
+        assert df['flag'].dtype == 'boolean'
+        assert df['flag'].isna().tolist() == [False, True, True, True, False]
+        assert df['flag'][0] and not df['flag'][4]
+
+    def test_nullable_boolean_with_na_is_kept(self, caplog):
+        df = pd.DataFrame({'flag': pd.array([True, None, False], dtype='boolean')})
+        _convert_column(df, 'flag', 'bool')
+        assert 'Error converting' not in caplog.text
+        assert df['flag'].dtype == 'boolean'
+        assert df['flag'].isna().tolist() == [False, True, False]
+
+
+class TestSaveTable:
+    @pytest.fixture
+    def frame(self):
+        return pd.DataFrame({
+            'game_id': np.arange(7),
+            'play_type': pd.Categorical(['Jump', 'Foul', 'Jump', 'Foul', 'Jump', 'Foul', 'Jump']),
+            'text': [None, None, None, 'a', 'b', None, 'c'],
+        })
+
+    def test_streamed_row_groups_round_trip(self, tmp_path, frame):
+        import pyarrow.parquet as pq
+        parquet_path = tmp_path / 'pbp.parquet'
+        _save_table(frame, tmp_path / 'pbp.csv', parquet_path, row_group_size=3)
+        assert pq.ParquetFile(parquet_path).num_row_groups == 3
+        pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), frame)
+
+    def test_streamed_csv_matches_single_shot(self, tmp_path, frame):
+        configure(write_csv=True)
+        try:
+            _save_table(frame, tmp_path / 'a.csv', tmp_path / 'a.parquet', row_group_size=3)
+            _save_table(frame, tmp_path / 'b.csv', tmp_path / 'b.parquet')
+        finally:
+            configure(write_csv=False)
+        assert (tmp_path / 'a.csv').read_text() == (tmp_path / 'b.csv').read_text()
+        assert len(pd.read_csv(tmp_path / 'a.csv')) == len(frame)
+
+    def test_no_csv_without_write_csv(self, tmp_path, frame):
+        configure(write_csv=False)
+        _save_table(frame, tmp_path / 'a.csv', tmp_path / 'a.parquet', row_group_size=3)
+        _save_table(frame, tmp_path / 'b.csv', tmp_path / 'b.parquet')
+        assert not (tmp_path / 'a.csv').exists()
+        assert not (tmp_path / 'b.csv').exists()
+        assert (tmp_path / 'a.parquet').exists() and (tmp_path / 'b.parquet').exists()
+
+
+class TestProcessTeamsData:
+    def test_empty_and_missing_logos_are_none(self, tmp_path):
+        original_data_dir = get_config().data_dir
+        configure(data_dir=tmp_path)
+        try:
+            teams = [{'id': '1', 'displayName': 'A', 'logos': []},
+                     {'id': '2', 'displayName': 'B', 'logos': None},
+                     {'id': '3', 'displayName': 'C'}]
+            save_json(teams, get_teams_file())
+            result = process_teams_data(force=True)
+        finally:
+            configure(data_dir=original_data_dir)
+        assert len(result) == 3
+        assert result['logo'].isna().all()
+
+    def test_logo_is_first_href(self, tmp_path):
+        original_data_dir = get_config().data_dir
+        configure(data_dir=tmp_path)
+        try:
+            teams = [{'id': '1', 'logos': [{'href': 'a.png'}, {'href': 'b.png'}]}, {'id': '2', 'logos': []}]
+            save_json(teams, get_teams_file())
+            result = process_teams_data(force=True)
+        finally:
+            configure(data_dir=original_data_dir)
+        assert result['logo'].tolist()[0] == 'a.png'
+        assert pd.isna(result['logo'].tolist()[1])
+
+
 class TestGetBroadcasts:
     def test_top_level_broadcasts(self):
         data = {'broadcasts': [{'media': {'shortName': 'ESPN'}}]}